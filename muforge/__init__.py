@@ -14,24 +14,34 @@ EVENT_HUB = None
 LOCKFUNCS = dict()
 LISTENERS = dict()
 LISTENERS_TABLE = dict()
+# Filled from GAME.networking.trusted_proxy_ips at setup.
+TRUSTED_PROXY_IPS: frozenset[str] = frozenset()
 
 PORTAL_COMMANDS = dict()
 PORTAL_COMMANDS_PRIORITY = defaultdict(list)
+# Every command in priority order, built once at setup.
+PORTAL_COMMANDS_SORTED = list()
 
 GAME_COMMANDS = dict()
 GAME_COMMANDS_PRIORITY = defaultdict(list)
+# Every command in priority order, built once at setup.
+GAME_COMMANDS_SORTED = list()
 
 LOCATIONS: dict[str, "Location"] = dict()
 LOCATION_CLASSES = dict()
 LOCATION_COMPONENTS = dict()
 
 USERS: dict[uuid.UUID, "UserModel"] = dict()
+# lowercased email -> user, kept in sync with USERS.
+USERS_EMAIL_INDEX: dict[str, "UserModel"] = dict()
 
 ENTITIES: dict[uuid.UUID, "BaseEntity"] = dict()
 ENTITY_CLASSES = dict()
 ENTITY_COMPONENTS = dict()
 
 ENTITY_TYPE_INDEX: dict[str, set["BaseEntity"]] = defaultdict(set)
+# lowercased name -> entity indexed as "player", maintained by BaseEntity.register_entity.
+PLAYER_NAMES: dict[str, "Player"] = dict()
 
 ATTRIBUTES = dict()
 NODES = dict()
@@ -2,12 +2,15 @@ import muforge
 import asyncio
 import tomllib
 
+from datetime import datetime, timedelta, timezone
+
 from lark import Lark
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 
 from hypercorn import Config
 from hypercorn.asyncio import serve
@@ -29,12 +32,18 @@ class Application(OldApplication):
             for name, command in callables_from_module(v).items():
                 muforge.GAME_COMMANDS[command.name] = command
                 muforge.GAME_COMMANDS_PRIORITY[command.priority].append(command)
+        muforge.GAME_COMMANDS_SORTED[:] = [
+            command
+            for priority in sorted(muforge.GAME_COMMANDS_PRIORITY.keys())
+            for command in muforge.GAME_COMMANDS_PRIORITY[priority]
+        ]
 
     async def setup_fastapi(self):
         settings = muforge.SETTINGS
         shared = settings["SHARED"]
         tls = settings["TLS"]
         networking = settings["GAME"]["networking"]
+        muforge.TRUSTED_PROXY_IPS = frozenset(networking["trusted_proxy_ips"])
         self.fastapi_config = Config()
         self.fastapi_config.title = settings["MSSP"]["NAME"]
 
@@ -48,7 +57,7 @@ class Application(OldApplication):
         if Path(tls["key"]).exists():
             self.fastapi_config.keyfile = str(Path(tls["key"]).absolute())
 
-        self.fastapi_instance = FastAPI()
+        self.fastapi_instance = FastAPI(default_response_class=ORJSONResponse)
         app = self.fastapi_instance
 
         app.add_middleware(
@@ -74,12 +83,12 @@ class Application(OldApplication):
 
         @app.get("/", response_class=HTMLResponse)
         async def root():
-            return render_index()
+            return await run_in_threadpool(render_index)
 
 
         @app.get("/index.html", response_class=HTMLResponse)
         async def index_html():
-            return render_index()
+            return await run_in_threadpool(render_index)
 
         routers = settings["FASTAPI"]["routers"]
         for k, v in routers.items():
@@ -148,13 +157,40 @@ class Application(OldApplication):
 
         try:
             while True:
-                for k, v in muforge.SESSIONS.items():
-                    await v.send_event(SystemPing())
+                # One ping is shared by every session; it carries no per-session state.
+                ping = SystemPing()
+                # Snapshot; sessions can come and go while we're awaiting.
+                for k, v in list(muforge.SESSIONS.items()):
+                    await v.send_event(ping)
                 await asyncio.sleep(15)
         except asyncio.CancelledError:
             return
 
+    async def session_reaper(self):
+        """
+        Periodically stops sessions that have no event stream attached and haven't
+        executed a command in a while, e.g. a session whose stream never started.
+        Sessions with a live stream are never reaped; they end when the stream closes.
+        """
+        settings = muforge.SETTINGS["GAME"].get("sessions", dict())
+        idle_timeout = settings.get("idle_timeout", 3600)
+        interval = settings.get("reap_interval", 60)
+        if idle_timeout <= 0 or interval <= 0:
+            return
+        timeout = timedelta(seconds=idle_timeout)
+
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                cutoff = datetime.now(timezone.utc) - timeout
+                for k, v in list(muforge.SESSIONS.items()):
+                    if not v.subscriptions and v.last_active_at < cutoff:
+                        await v.stop(graceful=False)
+        except asyncio.CancelledError:
+            return
+
     async def start(self):
         self.task_group.create_task(serve(self.fastapi_instance, self.fastapi_config))
         #self.task_group.create_task(self.postgre_listener())
         self.task_group.create_task(self.system_pinger())
+        self.task_group.create_task(self.session_reaper())
@@ -1,6 +1,7 @@
 from asyncpg import Connection
 from asyncpg.exceptions import UniqueViolationError
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from datetime import datetime, timezone
 
@@ -18,12 +19,11 @@ async def register_user(
     if not muforge.USERS:
         admin_level = 10
     
-    for k, v in muforge.USERS.items():
-        if v.email.lower() == email.lower():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User already exists.",
-            )
+    if email.lower() in muforge.USERS_EMAIL_INDEX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User already exists.",
+        )
     id = fresh_uuid4(muforge.USERS.keys())
     data = {
         "id": id,
@@ -39,6 +39,7 @@ async def register_user(
 
     user = UserModel(**data)
     muforge.USERS[id] = user
+    muforge.USERS_EMAIL_INDEX[email.lower()] = user
 
     return user
 
@@ -46,15 +47,12 @@ async def register_user(
 async def authenticate_user(
     email: str, password: str, ip: str, user_agent: str | None
 ) -> UserModel:
-    user = None
-    for k, v in muforge.USERS.items():
-        if v.email.lower() == email.lower():
-            user = v
-            break
-    if not user:
+    if not (user := muforge.USERS_EMAIL_INDEX.get(email.lower(), None)):
         raise HTTPException(status_code=400, detail="Invalid credentials.")
     
-    if not crypt_context.verify(password, user.password.get_secret_value()):
+    if not await run_in_threadpool(
+        crypt_context.verify, password, user.password.get_secret_value()
+    ):
         raise HTTPException(status_code=400, detail="Invalid credentials.")
 
     return user
@@ -11,9 +11,8 @@ from muforge.shared.models.characters import CharacterModel, ActiveAs
 from muforge.shared.utils import fresh_uuid4
 
 async def find_character_name(name: str) -> CharacterModel:
-    for v in muforge.ENTITY_TYPE_INDEX.get("player", list()):
-        if v.name.lower() == name.lower():
-            return v.to_model()
+    if (v := muforge.PLAYER_NAMES.get(name.lower(), None)):
+        return v.to_model()
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND, detail="Character not found"
     )
@@ -22,9 +21,9 @@ async def find_character_name(name: str) -> CharacterModel:
 async def find_character_id(
     character_id: uuid.UUID
 ) -> CharacterModel:
-    for v in muforge.ENTITY_TYPE_INDEX.get("player", list()):
-        if v.id == character_id:
-            return v.to_model()
+    v = muforge.ENTITIES.get(character_id, None)
+    if v is not None and "player" in v.entity_indexes:
+        return v.to_model()
     raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Character not found"
         )
@@ -34,9 +33,7 @@ async def find_character_id(
 async def list_characters(
 
 ) -> typing.AsyncGenerator[CharacterModel, None]:
-    query = "SELECT * FROM character_view"
-    # Use a cursor to stream results rather than loading everything into memory at once.
-    for t in muforge.ENTITY_TYPE_INDEX.get("player", list()):
+    for t in muforge.ENTITY_TYPE_INDEX.get("player", ()):
         yield t.to_model()
 
 
@@ -44,7 +41,7 @@ async def list_characters(
 async def list_characters_user(
     user: UserModel
 ) -> typing.AsyncGenerator[CharacterModel, None]:
-    for t in muforge.ENTITY_TYPE_INDEX.get("player", list()):
+    for t in muforge.ENTITY_TYPE_INDEX.get("player", ()):
         if t.user_id == user.id and t.deleted_at is None:
             yield t.to_model()
 
@@ -56,11 +53,10 @@ async def create_character(
     character_class = muforge.ENTITY_CLASSES["player"]
     id = fresh_uuid4(muforge.ENTITIES.keys())
 
-    for v in muforge.ENTITY_TYPE_INDEX.get("player", list()):
-        if v.name.lower() == name.lower():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT, detail="Character name already in use"
-            )
+    if name.lower() in muforge.PLAYER_NAMES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Character name already in use"
+        )
     
     character = character_class(id=id, name=name, user_id=user.id)
     user = muforge.USERS.get(user.id)
@@ -72,7 +68,7 @@ async def create_character(
 async def list_online(conn: Connection) -> list[ActiveAs]:
     return [
         ActiveAs(
-            character=v.pc.to_model(), user=muforge.USERS[v.user_id]
+            character=v.pc.to_model(), user=v.user
         )
         for k, v in muforge.SESSIONS.items()
     ]
\ No newline at end of file
@@ -16,9 +16,8 @@ async def get_user(user_id: uuid.UUID) -> UserModel:
 
     
 async def find_user(email: str) -> UserModel:
-    for k, v in muforge.USERS.items():
-        if v.email.lower() == email.lower():
-            return v
+    if (user := muforge.USERS_EMAIL_INDEX.get(email.lower(), None)):
+        return user
     raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found.",
@@ -61,11 +61,9 @@ class BaseEntity:
         return out
 
     def iter_commands(self):
-        priorities = sorted(muforge.GAME_COMMANDS_PRIORITY.keys())
-        for priority in priorities:
-            for command in muforge.GAME_COMMANDS_PRIORITY[priority]:
-                if command.check_access(self):
-                    yield command
+        for command in muforge.GAME_COMMANDS_SORTED:
+            if command.check_access(self):
+                yield command
 
     def match_command(self, cmd: str) -> typing.Optional["Command"]:
         for command in self.iter_commands():
@@ -117,10 +115,13 @@ class BaseEntity:
         muforge.ENTITIES[self.id] = self
         for idx in self.entity_indexes:
             muforge.ENTITY_TYPE_INDEX[idx].add(self)
+        if "player" in self.entity_indexes:
+            muforge.PLAYER_NAMES[self.name.lower()] = self
     
     def unregister_entity(self):
-        if self.id in muforge.ENTITIES:
-            del muforge.ENTITIES[self.id]
+        muforge.ENTITIES.pop(self.id, None)
         for idx in self.entity_indexes:
-            if self in muforge.ENTITY_TYPE_INDEX[idx]:
-                muforge.ENTITY_TYPE_INDEX[idx].remove(self)
\ No newline at end of file
+            muforge.ENTITY_TYPE_INDEX[idx].discard(self)
+        if "player" in self.entity_indexes:
+            if muforge.PLAYER_NAMES.get(self.name.lower(), None) is self:
+                del muforge.PLAYER_NAMES[self.name.lower()]
\ No newline at end of file
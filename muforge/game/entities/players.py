@@ -34,4 +34,5 @@ class Player(Character):
             "deleted_at": self.deleted_at,
             "last_active_at": self.last_active_at
         }
-        return CharacterModel(**data)
\ No newline at end of file
+        # The name was validated as a name_line by CharacterCreate; ids and timestamps are ours.
+        return CharacterModel.model_construct(**data)
\ No newline at end of file
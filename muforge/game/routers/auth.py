@@ -5,6 +5,7 @@ import jwt
 
 from fastapi import APIRouter, Depends, Body, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.concurrency import run_in_threadpool
 
 from muforge.shared.models.auth import TokenResponse, UserLogin, RefreshTokenModel
 
@@ -27,7 +28,10 @@ async def handle_login(request: Request, email: str, password: str) -> TokenResp
 async def register(request: Request, data: Annotated[UserLogin, Body()]):
 
     try:
-        hashed = crypt_context.hash(data.password.get_secret_value())
+        # argon2 is deliberately slow; keep it off the event loop.
+        hashed = await run_in_threadpool(
+            crypt_context.hash, data.password.get_secret_value()
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Error hashing password."
@@ -5,7 +5,7 @@ import typing
 import uuid
 
 from fastapi import APIRouter, Depends, Body, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, Response
 
 from pydantic import BaseModel
 
@@ -17,6 +17,9 @@ from muforge.game.db import characters as characters_db
 
 router = APIRouter()
 
+# Static acknowledgement for submitted commands; no need to run it through an encoder.
+_COMMAND_OK = b'{"status":"ok"}'
+
 
 @router.get("/", response_model=typing.List[CharacterModel])
 async def get_characters(user: Annotated[UserModel, Depends(get_current_user)]):
@@ -48,6 +51,19 @@ async def get_character_active_as(
     return acting
 
 
+def _get_or_create_session(character_id: uuid.UUID, character) -> tuple["Session", bool]:
+    """
+    Returns the character's active session, creating and registering one if needed.
+    The bool is True if the session was created and still needs to be started.
+    """
+    if (session := muforge.SESSIONS.get(character_id, None)) and session.active:
+        return session, False
+    session_class = muforge.CLASSES["session"]
+    session = session_class(character)
+    muforge.SESSIONS[character_id] = session
+    return session, True
+
+
 @router.get("/{character_id}/events")
 async def stream_character_events(
     user: Annotated[UserModel, Depends(get_current_user)], character_id: uuid.UUID
@@ -56,22 +72,24 @@ async def stream_character_events(
     acting = await get_acting_character(user, character_id)
 
     character = muforge.ENTITIES.get(character_id)
-    started = False
-    if not (session := muforge.SESSIONS.get(character_id, None)):
-        session_class = muforge.CLASSES["session"]
-        session = session_class(character)
-        muforge.SESSIONS[character_id] = session
-        started = True
+    session, started = _get_or_create_session(character_id, character)
 
     async def event_generator():
+        nonlocal session, started
         queue = session.subscribe()
+        if not session.active:
+            # The session was stopped between lookup and subscribing (e.g. an old
+            # connection closing). Stream from a live session instead.
+            session.unsubscribe(queue)
+            session, started = _get_or_create_session(character_id, character)
+            queue = session.subscribe()
         graceful = False
         try:
             if started:
                 await session.start()
             # blocks until a new event
             while item := await queue.get():
-                yield f"event: {item.__class__.__name__}\ndata: {item.model_dump_json()}\n\n"
+                yield item.to_sse()
             graceful = True
         finally:
             session.unsubscribe(queue)
@@ -103,7 +121,7 @@ async def submit_command(
 
     await session.execute_command(command.command)
 
-    return {"status": "ok"}
+    return Response(content=_COMMAND_OK, media_type="application/json")
 
 @router.post("/", response_model=CharacterModel)
 async def create_character(
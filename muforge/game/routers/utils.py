@@ -41,10 +41,11 @@ def streaming_list(data: typing.AsyncGenerator[pydantic.BaseModel, None]) -> Str
 def get_real_ip(request: Request):
     """
     If the request is behind a trusted proxy, then we'll trust X-Forwarded-For and use the first IP in the list.
-    trusted proxies are in muforge.SETTINGS["GAME"]["networking"]["trusted_proxy_ips"]
+    trusted proxies are in muforge.SETTINGS["GAME"]["networking"]["trusted_proxy_ips"],
+    cached as a frozenset in muforge.TRUSTED_PROXY_IPS.
     """
     ip = request.client.host
-    if ip in muforge.SETTINGS["GAME"]["networking"]["trusted_proxy_ips"]:
+    if ip in muforge.TRUSTED_PROXY_IPS:
         ip = request.headers.get("X-Forwarded-For", ip).split(",")[0].strip()
     return ip
 
@@ -7,6 +7,17 @@ from datetime import datetime, timezone
 from muforge.shared.events.messages import Text, Line
 
 class Session:
+    __slots__ = (
+        "pc",
+        "puppet",
+        "created_at",
+        "last_active_at",
+        "subscriptions",
+        "active",
+        "user",
+        "command_lock",
+        "__weakref__",
+    )
 
     def __init__(self, pc: "PlayerCharacter"):
         pc.session = self
@@ -17,6 +28,8 @@ class Session:
         self.subscriptions: list[asyncio.Queue] = []
         self.active = True
         self.user = muforge.USERS.get(pc.user_id)
+        # Serializes commands so concurrent submissions can't interleave at awaits.
+        self.command_lock = asyncio.Lock()
 
     async def send_event(self, event) -> None:
         for q in self.subscriptions:
@@ -37,7 +50,8 @@ class Session:
     
     async def execute_command(self, command: str) -> None | dict:
         self.last_active_at = datetime.now(timezone.utc)
-        return await self.puppet.execute_command(command)
+        async with self.command_lock:
+            return await self.puppet.execute_command(command)
     
     def subscribe(self) -> asyncio.Queue:
         """Create a new queue for this character and add it to the subscription list."""
@@ -66,4 +80,10 @@ class Session:
 
     async def stop(self, graceful: bool = True):
         if not self.active:
-            return
\ No newline at end of file
+            return
+        self.active = False
+        await self.stop_local()
+        if muforge.SESSIONS.get(self.pc.id, None) is self:
+            del muforge.SESSIONS[self.pc.id]
+        if self.pc.session is self:
+            self.pc.session = None
@@ -28,6 +28,11 @@ class Application(_Application):
             for name, command in callables_from_module(v).items():
                 muforge.PORTAL_COMMANDS[command.name] = command
                 muforge.PORTAL_COMMANDS_PRIORITY[command.priority].append(command)
+        muforge.PORTAL_COMMANDS_SORTED[:] = [
+            command
+            for priority in sorted(muforge.PORTAL_COMMANDS_PRIORITY.keys())
+            for command in muforge.PORTAL_COMMANDS_PRIORITY[priority]
+        ]
 
     async def handle_new_protocol(self, protocol):
         protocol.core = self
@@ -80,11 +80,9 @@ class CharacterParser(BaseParser):
         return out
 
     def iter_commands(self):
-        priorities = sorted(muforge.PORTAL_COMMANDS_PRIORITY.keys())
-        for priority in priorities:
-            for command in muforge.PORTAL_COMMANDS_PRIORITY[priority]:
-                if command.check_access(self.active):
-                    yield command
+        for command in muforge.PORTAL_COMMANDS_SORTED:
+            if command.check_access(self.active):
+                yield command
 
     def match_command(self, cmd: str) -> typing.Optional["Command"]:
         for command in self.iter_commands():
@@ -1,5 +1,5 @@
 import pydantic
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 import datetime
 
 
@@ -8,6 +8,17 @@ class EventBase(pydantic.BaseModel):
     """
     Base class for all events.
     """
+    _sse_frame: str | None = PrivateAttr(default=None)
+
+    def to_sse(self) -> str:
+        """
+        Render this event as a Server-Sent Events frame.
+
+        The frame is cached; the same event is often delivered to many subscribers.
+        """
+        if self._sse_frame is None:
+            self._sse_frame = f"event: {self.__class__.__name__}\ndata: {self.model_dump_json()}\n\n"
+        return self._sse_frame
 
     async def handle_event(self, conn: "BaseConnection"):
         pass
@@ -20,4 +20,4 @@ class ActiveAs(pydantic.BaseModel):
     character: CharacterModel
 
 class CharacterCreate(pydantic.BaseModel):
-    name: str
\ No newline at end of file
+    name: name_line
\ No newline at end of file
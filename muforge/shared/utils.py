@@ -399,11 +399,12 @@ class lazy_property:
 
 def fresh_uuid4(existing) -> uuid:
     """
-    Given a list of UUID4s, generate a new one that's not already used.
+    Given a container of existing UUID4s (a set or dict keys view), generate a new one that's not already used.
     Yes, I know this is silly. UUIDs are meant to be unique by sheer statistic unlikelihood of a conflict.
     I'm just that afraid of collisions.
+
+    existing should support fast membership tests (a set, or dict.keys()); it is not copied.
     """
-    existing = set(existing)
     fresh_uuid = uuid.uuid4()
     while fresh_uuid in existing:
         fresh_uuid = uuid.uuid4()
@@ -452,12 +453,16 @@ def partial_match(
     return out if many_results else None
 
 
+_NAME_CHARS = string.ascii_letters + string.digits
+
+
 def generate_name(prefix: str, existing, gen_length: int = 20) -> str:
     def gen():
-        return f"{prefix}_{''.join(random.choices(string.ascii_letters + string.digits, k=gen_length))}"
+        return f"{prefix}_{''.join(random.choices(_NAME_CHARS, k=gen_length))}"
 
-    while (u := gen()) not in existing:
-        return u
+    while (u := gen()) in existing:
+        continue
+    return u
 
 
 def get_server_pid() -> typing.Optional[int]: